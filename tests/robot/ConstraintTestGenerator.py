@@ -3,8 +3,23 @@ Dynamic constraint test generator for Robot Framework.
 Loads constraints from schema and generates test cases automatically.
 """
 
-import yaml
-import os
+import schema_cache
+
+# Candidate schema locations (Docker vs local), overridable via BLOOM_SCHEMA_PATH
+_SCHEMA_PATHS = [
+    "/robot/schema/bloom.yaml.schema.yaml",  # Docker mount
+    "../../pkg/config/bloom.yaml.schema.yaml",   # Current location relative
+    "../pkg/config/bloom.yaml.schema.yaml",      # Alternative relative
+    "../../schema/bloom.yaml.schema.yaml",   # Legacy location
+    "../schema/bloom.yaml.schema.yaml",      # Legacy alternative
+]
+
+# Fallback example values for fields with built-in types
+_TYPE_DEFAULTS = {
+    'str': 'test-value',
+    'bool': True,
+    'int': 1,
+}
 
 
 class ConstraintTestGenerator:
@@ -13,71 +28,72 @@ class ConstraintTestGenerator:
     ROBOT_LIBRARY_SCOPE = 'GLOBAL'
 
     def __init__(self):
+        # Schema is parsed on first keyword call, not at library import
+        self._loaded = False
         self.constraints = []
-        self._load_constraints()
+        self.schema = {}
+        self.types = {}
+
+    def _ensure_loaded(self):
+        """Load constraints from the schema if not done yet"""
+        if not self._loaded:
+            self._load_constraints()
+            self._loaded = True
 
     def _load_constraints(self):
         """Load constraints from schema file"""
-        # Try multiple paths for schema file (Docker vs local)
-        possible_paths = [
-            "/robot/schema/bloom.yaml.schema.yaml",  # Docker mount
-            "../../pkg/config/bloom.yaml.schema.yaml",   # Current location relative
-            "../pkg/config/bloom.yaml.schema.yaml",      # Alternative relative
-            "../../schema/bloom.yaml.schema.yaml",   # Legacy location
-            "../schema/bloom.yaml.schema.yaml",      # Legacy alternative
-        ]
-
-        schema_data = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                with open(path, 'r') as f:
-                    schema_data = yaml.safe_load(f)
-                break
-
-        if schema_data is None:
-            raise FileNotFoundError(
-                f"Schema file not found in any of: {possible_paths}"
-            )
+        path = schema_cache.resolve_schema_path(_SCHEMA_PATHS)
+        schema_data = schema_cache.load_schema(path)
 
         self.constraints = schema_data.get('constraints', [])
         self.schema = schema_data.get('schema', {})
         self.types = schema_data.get('types', {})
 
+        # Bucket constraints by kind once so the getters don't rescan
+        self._mutex = [
+            c['mutually_exclusive'] for c in self.constraints
+            if 'mutually_exclusive' in c
+        ]
+        self._one_of = [
+            {'fields': c['one_of'], 'error': c.get('error', '')}
+            for c in self.constraints
+            if 'one_of' in c
+        ]
+
+        # The schema is static, so resolve every field's example up front
+        self._examples_by_field = {}
+        for field_name, field_def in self.schema.get('mapping', {}).items():
+            example = self._lookup_example(field_def)
+            if example is not None:
+                self._examples_by_field[field_name] = example
+
     def get_mutually_exclusive_constraints(self):
         """Return all mutually exclusive constraints"""
-        result = []
-        for constraint in self.constraints:
-            if 'mutually_exclusive' in constraint:
-                result.append(constraint['mutually_exclusive'])
-        return result
+        self._ensure_loaded()
+        # Copy so callers mutating the result can't alter later calls
+        return [list(fields) for fields in self._mutex]
 
     def get_one_of_constraints(self):
         """Return all one-of constraints"""
-        result = []
-        for constraint in self.constraints:
-            if 'one_of' in constraint:
-                result.append({
-                    'fields': constraint['one_of'],
-                    'error': constraint.get('error', '')
-                })
-        return result
+        self._ensure_loaded()
+        return [
+            {'fields': list(c['fields']), 'error': c['error']}
+            for c in self._one_of
+        ]
 
     def get_valid_examples_for_fields(self, field_names):
         """Get valid example values for multiple fields"""
-        result = {}
-        for field_name in field_names:
-            example = self.get_valid_example_for_field(field_name)
-            if example is not None:
-                result[field_name] = example
-        return result
+        self._ensure_loaded()
+        examples = self._examples_by_field
+        return {f: examples[f] for f in field_names if f in examples}
 
     def get_valid_example_for_field(self, field_name):
         """Get a valid example value for a field from schema"""
-        # Get field definition from schema
-        if 'mapping' not in self.schema:
-            return None
+        self._ensure_loaded()
+        return self._examples_by_field.get(field_name)
 
-        field_def = self.schema['mapping'].get(field_name)
+    def _lookup_example(self, field_def):
+        """Resolve an example value for a field from its schema definition"""
         if not field_def:
             return None
 
@@ -99,9 +115,4 @@ class ConstraintTestGenerator:
                     return valid_examples[0]
 
         # Fallback defaults by type
-        type_defaults = {
-            'str': 'test-value',
-            'bool': True,
-            'int': 1,
-        }
-        return type_defaults.get(field_type, 'test-value')
+        return _TYPE_DEFAULTS.get(field_type, 'test-value')
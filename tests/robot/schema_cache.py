@@ -0,0 +1,61 @@
+"""
+Shared schema loading for the Robot Framework helper libraries.
+Parsed documents are cached per process so the libraries reuse each other's parse.
+"""
+import yaml
+import os
+
+# Prefer libyaml's C parser when available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed schema documents keyed by absolute path, stored as (mtime_ns, data)
+_SCHEMA_CACHE = {}
+
+# Resolved schema path per candidate list, filled on first lookup
+_RESOLVED_SCHEMA_PATHS = {}
+
+
+def load_schema(path):
+    """Parse a schema file, reusing the cached result while its mtime is unchanged"""
+    path = os.path.abspath(path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _SCHEMA_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    _SCHEMA_CACHE[path] = (mtime, data)
+    return data
+
+
+def resolve_schema_path(candidates):
+    """
+    Return the schema path from BLOOM_SCHEMA_PATH or the first existing candidate.
+
+    The candidate probe runs once per candidate list; later calls reuse its result
+    while that file still exists and probe again otherwise.
+    Raises FileNotFoundError listing what was tried when no schema is found.
+    """
+    override = os.environ.get("BLOOM_SCHEMA_PATH")
+    if override:
+        if os.path.exists(override):
+            return override
+        tried = [f"BLOOM_SCHEMA_PATH={override}"]
+    else:
+        key = tuple(candidates)
+        path = _RESOLVED_SCHEMA_PATHS.get(key)
+        if path is not None:
+            if os.path.exists(path):
+                return path
+            del _RESOLVED_SCHEMA_PATHS[key]
+
+        for path in candidates:
+            if os.path.exists(path):
+                path = os.path.abspath(path)
+                _RESOLVED_SCHEMA_PATHS[key] = path
+                return path
+        tried = candidates
+
+    tried = '\n  '.join(tried)
+    raise FileNotFoundError(f"Could not find bloom.yaml.schema.yaml. Tried:\n  {tried}")
@@ -1,8 +1,40 @@
 """
 Helper library to load YAML schema and extract test examples for Robot Framework
 """
-import yaml
-import os
+
+import schema_cache
+
+# Candidate schema locations, overridable via BLOOM_SCHEMA_PATH
+_SCHEMA_PATHS = [
+    '/robot/schema/bloom.yaml.schema.yaml',  # Current location
+]
+
+# Fields that require CERT_OPTION=existing
+_CERT_STEPS = (
+    {'action': 'wait', 'target': 'CERT_OPTION'},
+    {'action': 'select', 'target': 'CERT_OPTION', 'value': 'existing'},
+)
+
+# Fields that require FIRST_NODE=false
+_JOINING_NODE_STEPS = (
+    {'action': 'uncheck', 'target': 'FIRST_NODE'},
+)
+
+# Fields that require GPU_NODE=true (ensure it's checked)
+_GPU_NODE_STEPS = (
+    {'action': 'check', 'target': 'GPU_NODE'},
+)
+
+# Steps to run before waiting for a field to become visible, by field name
+_VISIBILITY_STEPS = {
+    'TLS_CERT': _CERT_STEPS,
+    'TLS_KEY': _CERT_STEPS,
+    'SERVER_IP': _JOINING_NODE_STEPS,
+    'JOIN_TOKEN': _JOINING_NODE_STEPS,
+    'CONTROL_PLANE': _JOINING_NODE_STEPS,
+    'ROCM_BASE_URL': _GPU_NODE_STEPS,
+    'ROCM_DEB_PACKAGE': _GPU_NODE_STEPS,
+}
 
 
 def load_schema_examples():
@@ -17,25 +49,8 @@ def load_schema_examples():
     - invalid: List of invalid example values
     - visibility: List of steps to make field visible (optional)
     """
-    # Try multiple possible paths
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    schema_paths = [
-        os.path.join('/robot/schema/bloom.yaml.schema.yaml'),  # Current location
-    ]
-
-    schema_path = None
-    for path in schema_paths:
-        if os.path.exists(path):
-            schema_path = path
-            break
-
-    if not schema_path:
-        # Debug: show what we tried
-        tried = '\n  '.join(schema_paths)
-        raise FileNotFoundError(f"Could not find bloom.yaml.schema.yaml. Tried:\n  {tried}")
-
-    with open(schema_path, 'r') as f:
-        schema = yaml.safe_load(f)
+    schema_path = schema_cache.resolve_schema_path(_SCHEMA_PATHS)
+    schema = schema_cache.load_schema(schema_path)
 
     # Map of field names to their types and examples
     field_examples = []
@@ -46,33 +61,38 @@ def load_schema_examples():
     # Get field mappings
     fields = schema.get('schema', {}).get('mapping', {})
 
+    # Bind lookups used on every iteration to locals
+    get_type_def = type_defs.get
+    visibility_steps_for = get_visibility_steps
+
     for field_name, field_def in fields.items():
         field_type = field_def.get('type')
 
         # Skip fields without custom types (bool, str without patterns, etc.)
-        if field_type not in type_defs:
+        type_def = get_type_def(field_type)
+        if type_def is None:
             continue
 
-        # Get examples from type definition
-        type_def = type_defs[field_type]
-        examples = type_def.get('examples', {})
+        # Get examples from type definition, skipping types without any
+        examples = type_def.get('examples')
+        if not examples:
+            continue
 
         valid_examples = examples.get('valid', [])
         invalid_examples = examples.get('invalid', [])
-
-        # Skip if no examples
         if not valid_examples and not invalid_examples:
             continue
 
         # Determine visibility requirements
-        visibility_steps = get_visibility_steps(field_name, field_def)
+        visibility_steps = visibility_steps_for(field_name, field_def)
 
         field_info = {
             'field': field_name,
             'fieldId': field_name,
             'type': field_type,
-            'valid': valid_examples,
-            'invalid': invalid_examples,
+            # Copy so callers don't share lists with the cached schema
+            'valid': list(valid_examples),
+            'invalid': list(invalid_examples),
         }
 
         if visibility_steps:
@@ -89,25 +109,11 @@ def get_visibility_steps(field_name, field_def):
 
     Returns a list of step dictionaries with 'action' and 'target' keys.
     """
-    steps = []
-
-    # Fields that require CERT_OPTION=existing
-    if field_name in ['TLS_CERT', 'TLS_KEY']:
-        steps.append({'action': 'wait', 'target': 'CERT_OPTION'})
-        steps.append({'action': 'select', 'target': 'CERT_OPTION', 'value': 'existing'})
-        steps.append({'action': 'wait', 'target': field_name})
-
-    # Fields that require FIRST_NODE=false
-    elif field_name in ['SERVER_IP', 'JOIN_TOKEN', 'CONTROL_PLANE']:
-        steps.append({'action': 'uncheck', 'target': 'FIRST_NODE'})
-        steps.append({'action': 'wait', 'target': field_name})
-
-    # Fields that require GPU_NODE=true (ensure it's checked)
-    elif field_name in ['ROCM_BASE_URL', 'ROCM_DEB_PACKAGE']:
-        steps.append({'action': 'check', 'target': 'GPU_NODE'})
-        steps.append({'action': 'wait', 'target': field_name})
-
-    return steps if steps else None
+    base_steps = _VISIBILITY_STEPS.get(field_name)
+    if base_steps is None:
+        return None
+    # Copy the shared step templates so callers can't modify them
+    return [dict(s) for s in base_steps] + [{'action': 'wait', 'target': field_name}]
 
 
 if __name__ == '__main__':